@@ -49,6 +49,7 @@ import os
 import sys
 import re
 from datetime import datetime, timezone
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -64,6 +65,17 @@ MACOS_NAME_TRANSFORM = {
     "12": "Monterey 12"
 }
 
+# Pre-fetched data produced by sofa-gather / sofa-fetch
+RESOURCES_DIR = Path("data/resources")
+
+# Security release title patterns, compiled once instead of per release
+RSR_SUFFIX_RE = re.compile(r'\((\w)\)')
+MACOS_TITLE_VERSION_RE = re.compile(r'(?:macOS\s+(?:Sequoia|Sonoma|Ventura|Monterey|Big Sur)?\s*)(\d+)(?:\.(\d+))?', re.IGNORECASE)
+IOS_TITLE_VERSION_RE = re.compile(r'(?:iOS|iPadOS)\s+(\d+(?:\.\d+)*)', re.IGNORECASE)
+POINT_VERSION_RE = re.compile(r'(\d+\.\d+(?:\.\d+)?)')
+MACOS_BASE_VERSION_RE = re.compile(r'(?:macOS\s+(?:Sequoia|Sonoma|Ventura|Monterey|Big Sur)?\s*)(\d+)$', re.IGNORECASE)
+IOS_BASE_VERSION_RE = re.compile(r'(?:iOS|iPadOS)\s+(\d+)$', re.IGNORECASE)
+
 # packaging import is optional, will fall back to string sorting if not available
 try:
     import packaging.version
@@ -71,6 +83,13 @@ try:
 except ImportError:
     HAS_PACKAGING = False
 
+# orjson import is optional, parses the resource files much faster than the stdlib json
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 
 def main(os_types: list):
     """The main function to process OS version information based on the provided OS types"""
@@ -97,13 +116,12 @@ def load_gdmf_cached_data() -> dict:
     # First try to load from pre-fetched cache
     if gdmf_path.exists():
         try:
-            with open(gdmf_path, 'r', encoding='utf-8') as f:
-                cache_content = json.load(f)
-                # Handle both wrapped and direct format
-                cached_data = cache_content.get("data", cache_content)
-                if cached_data and isinstance(cached_data, dict):
-                    print("📦 Using pre-fetched GDMF data from cache")
-                    return cached_data
+            cache_content = json_loads(gdmf_path.read_bytes())
+            # Handle both wrapped and direct format
+            cached_data = cache_content.get("data", cache_content)
+            if cached_data and isinstance(cached_data, dict):
+                print("📦 Using pre-fetched GDMF data from cache")
+                return cached_data
         except Exception as e:
             print(f"⚠️  Error loading cached GDMF data: {e}")
     
@@ -111,12 +129,11 @@ def load_gdmf_cached_data() -> dict:
     legacy_cache_path = Path("cache/gdmf_cached.json")
     if legacy_cache_path.exists():
         try:
-            with open(legacy_cache_path, 'r', encoding='utf-8') as f:
-                cache_content = json.load(f)
-                cached_data = cache_content.get("data", cache_content)
-                if cached_data and isinstance(cached_data, dict):
-                    print("📦 Using GDMF data from legacy cache location")
-                    return cached_data
+            cache_content = json_loads(legacy_cache_path.read_bytes())
+            cached_data = cache_content.get("data", cache_content)
+            if cached_data and isinstance(cached_data, dict):
+                print("📦 Using GDMF data from legacy cache location")
+                return cached_data
         except Exception as e:
             print(f"⚠️  Error loading legacy GDMF cache: {e}")
     
@@ -125,88 +142,84 @@ def load_gdmf_cached_data() -> dict:
     return {}
 
 
+def load_resource_json(filename: str) -> Any:
+    """Load a JSON file from data/resources, returning None if it does not exist
+
+    Opens the file directly instead of probing with exists() first, so a
+    present file costs one open rather than a stat plus an open.
+    """
+    try:
+        return json_loads((RESOURCES_DIR / filename).read_bytes())
+    except FileNotFoundError:
+        return None
+
+
 def load_security_releases_data() -> List[Dict]:
     """Load security releases from pre-fetched data"""
-    data_dir = Path("data/resources")
-    security_path = data_dir / "apple_security_releases.json"
-    
-    if not security_path.exists():
-        print(f"⚠️  Security releases file not found: {security_path}")
-        return []
-    
     try:
-        with open(security_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get("releases", [])
+        return _read_security_releases()
+    except FileNotFoundError:
+        print(f"⚠️  Security releases file not found: {RESOURCES_DIR / 'apple_security_releases.json'}")
+        return []
     except Exception as e:
         print(f"⚠️  Error loading security releases: {e}")
         return []
 
 
+@cache
+def _read_security_releases() -> List[Dict]:
+    """Read the security releases once per process; callers treat the list as read-only
+
+    Errors propagate to load_security_releases_data, so only a successful
+    load is cached and a failure is retried by the next OS type.
+    """
+    data = json_loads((RESOURCES_DIR / "apple_security_releases.json").read_bytes())
+    return data.get("releases", [])
+
+
 def load_kev_data() -> Dict[str, bool]:
     """Load KEV catalog and return CVE -> exploited mapping"""
-    data_dir = Path("data/resources")
-    kev_path = data_dir / "kev_catalog.json"
-    
-    if not kev_path.exists():
-        return {}
-    
     try:
-        with open(kev_path, 'r', encoding='utf-8') as f:
-            kev = json.load(f)
-        
-        # Map CVE IDs to exploited status
-        kev_cves = {}
-        for vuln in kev.get("vulnerabilities", []):
-            if "cveID" in vuln:
-                kev_cves[vuln["cveID"]] = True
-        
-        return kev_cves
+        return _read_kev_cves()
     except Exception:
         return {}
 
 
-def load_xprotect_data() -> Dict:
-    """Load XProtect data from pre-fetched cache"""
-    data_dir = Path("data/resources")
-    xprotect_path = data_dir / "xprotect.json"
+@cache
+def _read_kev_cves() -> Dict[str, bool]:
+    """Build the CVE -> exploited mapping once per process (read-only, failures not cached)"""
+    kev = json_loads((RESOURCES_DIR / "kev_catalog.json").read_bytes())
     
-    if not xprotect_path.exists():
-        return {}
+    # Map CVE IDs to exploited status
+    kev_cves = {}
+    for vuln in kev.get("vulnerabilities", []):
+        cve_id = vuln.get("cveID")
+        if cve_id is not None:
+            kev_cves[cve_id] = True
     
+    return kev_cves
+
+
+def load_xprotect_data() -> Dict:
+    """Load XProtect data from pre-fetched cache"""
     try:
-        with open(xprotect_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_resource_json("xprotect.json") or {}
     except Exception:
         return {}
 
 
 def load_uma_data() -> Dict:
     """Load UMA catalog data"""
-    data_dir = Path("data/resources")
-    uma_path = data_dir / "uma_catalog.json"
-    
-    if not uma_path.exists():
-        return {}
-    
     try:
-        with open(uma_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_resource_json("uma_catalog.json") or {}
     except Exception:
         return {}
 
 
 def load_ipsw_data() -> Dict:
     """Load IPSW data"""
-    data_dir = Path("data/resources")
-    ipsw_path = data_dir / "ipsw.json"
-    
-    if not ipsw_path.exists():
-        return {}
-    
     try:
-        with open(ipsw_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_resource_json("ipsw.json") or {}
     except Exception:
         return {}
 
@@ -216,11 +229,20 @@ def load_and_tag_model_data() -> dict:
     models_dir = Path("data/models/legacy")
     combined_models = {}
     
+    # List the model identifier files with a single scandir pass
+    try:
+        with os.scandir(models_dir) as entries:
+            model_files = [
+                entry.path for entry in entries
+                if entry.name.startswith("model_identifier_") and entry.name.endswith(".json")
+            ]
+    except FileNotFoundError:
+        model_files = []
+    
     # Load all model identifier files
-    for model_file in models_dir.glob("model_identifier_*.json"):
+    for model_file in model_files:
         try:
-            with open(model_file, 'r', encoding='utf-8') as f:
-                model_data = json.load(f)
+            model_data = json_loads(Path(model_file).read_bytes())
                 
             # Each file contains an array of model categories
             for entry in model_data:
@@ -349,13 +371,9 @@ def build_os_versions_from_gdmf(os_type: str, gdmf_data: dict, security_releases
         
         os_versions.append(os_version_data)
     
-    # Sort by version number (newest first)
-    if HAS_PACKAGING:
-        os_versions.sort(key=lambda x: packaging.version.parse(
-            x["OSVersion"].split()[-1] if os_type == "macOS" else x["OSVersion"]
-        ), reverse=True)
-    else:
-        os_versions.sort(key=lambda x: x["OSVersion"].split()[-1] if os_type == "macOS" else x["OSVersion"], reverse=True)
+    # Sort by version number (newest first); OSVersion always ends in the bare
+    # major number from OS_RANGE_*, so a plain int key is enough
+    os_versions.sort(key=lambda x: int(x["OSVersion"].split()[-1]), reverse=True)
     
     return os_versions
 
@@ -377,9 +395,7 @@ def group_versions_by_major(versions: List[Dict], os_type: str) -> Dict[str, Lis
         
         try:
             major = product_version.split(".")[0]
-            if major not in groups:
-                groups[major] = []
-            groups[major].append(version)
+            groups.setdefault(major, []).append(version)
         except (IndexError, ValueError):
             continue
     
@@ -414,6 +430,7 @@ def fetch_security_releases(os_type: str, major_version: str, security_releases:
                           kev_data: Dict[str, bool], gdmf_latest: Dict) -> List[Dict]:
     """Fetch security releases for the given OS type and version"""
     releases = []
+    supported_devices = gdmf_latest.get("SupportedDevices", [])
     
     for release in security_releases:
         release_name = release.get("name", "")
@@ -425,21 +442,22 @@ def fetch_security_releases(os_type: str, major_version: str, security_releases:
         if not version_match:
             continue
         
-        # Get CVEs for this release with exploitation status
-        cves = {}
-        actively_exploited = []
-        
-        for cve_id in release.get("cves", []):
-            if isinstance(cve_id, str) and cve_id.startswith("CVE-"):
-                is_exploited = kev_data.get(cve_id, False)
-                cves[cve_id] = is_exploited
-                if is_exploited:
-                    actively_exploited.append(cve_id)
+        # Get CVEs for this release with exploitation status; a set intersection
+        # with the KEV catalog finds the (usually few) exploited ones in C
+        cves = dict.fromkeys(
+            (cve_id for cve_id in release.get("cves", [])
+             if isinstance(cve_id, str) and cve_id.startswith("CVE-")),
+            False
+        )
+        exploited = cves.keys() & kev_data.keys()
+        actively_exploited = [cve_id for cve_id in cves if cve_id in exploited] if exploited else []
+        for cve_id in actively_exploited:
+            cves[cve_id] = True
         
         # Determine release type
         release_type = "OS"
         if "Rapid Security Response" in release_name:
-            rsr_match = re.search(r'\((\w)\)', release_name)
+            rsr_match = RSR_SUFFIX_RE.search(release_name)
             if rsr_match:
                 release_type = f"RSR_{rsr_match.group(1)}"
             else:
@@ -452,7 +470,7 @@ def fetch_security_releases(os_type: str, major_version: str, security_releases:
             "ReleaseDate": format_iso_date(release.get("release_date", "")),
             "ReleaseType": release_type,
             "SecurityInfo": release.get("url", ""),
-            "SupportedDevices": gdmf_latest.get("SupportedDevices", []),
+            "SupportedDevices": list(supported_devices),  # copy so releases never alias Latest
             "CVEs": cves,
             "ActivelyExploitedCVEs": actively_exploited,
             "UniqueCVEsCount": len(cves),
@@ -469,52 +487,60 @@ def fetch_security_releases(os_type: str, major_version: str, security_releases:
 
 def matches_os_version(title: str, os_type: str, major_version: str) -> bool:
     """Check if security release title matches OS type and major version"""
+    return title_major_version(title, os_type) == major_version
+
+
+@lru_cache(maxsize=4096)
+def title_major_version(title: str, os_type: str) -> Optional[str]:
+    """Extract the OS major version a security release title refers to
+
+    Cached because every release title is checked once per major version
+    of each OS, so the regex work would otherwise repeat for each of them.
+    """
     title_lower = title.lower()
     
     if os_type == "macOS":
         # More precise matching - check for space before version to avoid matching "10.15" when looking for "15"
         # Match patterns like "macOS Sequoia 15", "macOS Sequoia 15.1" or "macOS 15" but not "10.15"
         if "macos" not in title_lower:
-            return False
+            return None
         
         # Handle base releases like "macOS Sequoia 15" (no point version)
         # and versioned releases like "macOS Sequoia 15.1"
         # Pattern matches: "macOS Sequoia 15" or "macOS Sequoia 15.x.x"
-        version_match = re.search(r'(?:macOS\s+(?:Sequoia|Sonoma|Ventura|Monterey|Big Sur)?\s*)(\d+)(?:\.(\d+))?', title, re.IGNORECASE)
+        version_match = MACOS_TITLE_VERSION_RE.search(title)
         if version_match:
-            extracted_major = version_match.group(1)
-            return extracted_major == major_version
-        return False
+            return version_match.group(1)
+        return None
         
     elif os_type == "iOS":
         if not ("ios" in title_lower or "ipados" in title_lower):
-            return False
+            return None
         
         # Extract iOS version more precisely
-        version_match = re.search(r'(?:iOS|iPadOS)\s+(\d+(?:\.\d+)*)', title, re.IGNORECASE)
+        version_match = IOS_TITLE_VERSION_RE.search(title)
         if version_match:
-            extracted_major = version_match.group(1).split('.')[0]
-            return extracted_major == major_version
-        return False
+            return version_match.group(1).split('.')[0]
+        return None
     
-    return False
+    return None
 
 
 def extract_version_from_title(title: str) -> Optional[str]:
     """Extract version number from security release title"""
     # First try to match versioned releases like "15.1" or "15.1.1"
-    version_match = re.search(r'(\d+\.\d+(?:\.\d+)?)', title)
+    version_match = POINT_VERSION_RE.search(title)
     if version_match:
         return version_match.group(1)
     
     # If no point version found, check for base releases like "macOS Sequoia 15"
     # This matches "15" at the end of the OS name
-    base_match = re.search(r'(?:macOS\s+(?:Sequoia|Sonoma|Ventura|Monterey|Big Sur)?\s*)(\d+)$', title, re.IGNORECASE)
+    base_match = MACOS_BASE_VERSION_RE.search(title)
     if base_match:
         return base_match.group(1) + ".0"  # Return as "15.0" for consistency
     
     # For iOS, similar logic
-    ios_base_match = re.search(r'(?:iOS|iPadOS)\s+(\d+)$', title, re.IGNORECASE)
+    ios_base_match = IOS_BASE_VERSION_RE.search(title)
     if ios_base_match:
         return ios_base_match.group(1) + ".0"
     
@@ -618,14 +644,26 @@ def add_compatible_machines(current_macos_full_version: str) -> List[Dict]:
     return compatible_machines
 
 
+@lru_cache(maxsize=4096)
 def format_iso_date(date_str: str) -> str:
-    """Format the date string to ISO 8601 format or a hardcoded date if the input is 'Preinstalled'"""
+    """Format the date string to ISO 8601 format or a hardcoded date if the input is 'Preinstalled'
+
+    Cached because Apple ships many releases on the same day, so the same
+    date strings are formatted over and over.
+    """
     if date_str == "Preinstalled":
         return "2021-10-25T00:00:00Z"
     
     if not date_str:
         return ""
     
+    # Fast path: plain ISO days parse in C via fromisoformat, strptime is pure Python
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return datetime.fromisoformat(date_str).isoformat() + "Z"
+        except ValueError:
+            pass
+    
     # Handle various date formats
     formats = ["%Y-%m-%d", "%d %b %Y", "%B %d, %Y"]
     for fmt in formats:
@@ -653,50 +691,43 @@ def write_data_to_json(feed_structure: dict, filename: str):
     output_dir = Path(os.environ.get('OUTPUT_DIR', '.'))
     output_path = output_dir / filename
     
-    latest_versions = {}
-
+    # Single pass: fill defaults and carry the matching security release date
+    # onto Latest. A release can only match the Latest of its own OSVersion,
+    # since both share the same major version.
     for os_version in feed_structure["OSVersions"]:
-        if "Latest" in os_version:
-            latest_dict = os_version["Latest"]
-
+        latest_dict = os_version.get("Latest")
+        latest_version = None
+        if latest_dict is not None:
             # Ensure all required keys are present with default values
-            latest_dict["ProductVersion"] = latest_dict.get("ProductVersion", "")
-            latest_dict["ReleaseDate"] = latest_dict.get("ReleaseDate", "")
-            latest_dict["ExpirationDate"] = latest_dict.get("ExpirationDate", "")
-            latest_dict["Build"] = latest_dict.get("Build", "")
-            latest_dict["SecurityInfo"] = latest_dict.get("SecurityInfo", "")
-            latest_dict["UniqueCVEsCount"] = latest_dict.get("UniqueCVEsCount", 0)
-            latest_dict["ActivelyExploitedCVEs"] = latest_dict.get("ActivelyExploitedCVEs", [])
-            latest_dict["CVEs"] = latest_dict.get("CVEs", {})
-            latest_dict["SupportedDevices"] = latest_dict.get("SupportedDevices", [])
-
-            product_version = latest_dict["ProductVersion"]
-
-            # Store the latest version info for comparison
-            latest_versions[product_version] = {
-                "latest_date": latest_dict["ReleaseDate"],
-                "os_version_dict": os_version
-            }
+            setdefault = latest_dict.setdefault
+            setdefault("ProductVersion", "")
+            setdefault("ReleaseDate", "")
+            setdefault("ExpirationDate", "")
+            setdefault("Build", "")
+            setdefault("SecurityInfo", "")
+            setdefault("UniqueCVEsCount", 0)
+            setdefault("ActivelyExploitedCVEs", [])
+            setdefault("CVEs", {})
+            setdefault("SupportedDevices", [])
+
+            latest_version = latest_dict["ProductVersion"]
 
         # Handle SecurityReleases similarly if present
-        if "SecurityReleases" in os_version and isinstance(os_version["SecurityReleases"], list):
-            for release in os_version["SecurityReleases"]:
-                release["ProductVersion"] = release.get("ProductVersion", "")
-                release["ReleaseDate"] = release.get("ReleaseDate", "")
-
-                product_version = release["ProductVersion"]
-                if product_version in latest_versions:
+        security_date = None
+        security_releases = os_version.get("SecurityReleases")
+        if isinstance(security_releases, list):
+            for release in security_releases:
+                product_version = release.setdefault("ProductVersion", "")
+                release_date = release.setdefault("ReleaseDate", "")
+
+                if product_version == latest_version:
                     # Update security date if the product version matches
-                    latest_versions[product_version]["security_date"] = release["ReleaseDate"]
-
-    # Update all relevant Latest entries with their respective security dates
-    for product_version, version_info in latest_versions.items():
-        if "security_date" in version_info:
-            latest_dict = version_info["os_version_dict"]["Latest"]
-            original_date = latest_dict.get("ReleaseDate", "")
-            new_date = version_info["security_date"]
-            latest_dict["ReleaseDate"] = new_date
-            print(f"Updated {product_version} ReleaseDate from {original_date} to {new_date}")
+                    security_date = release_date
+
+        if security_date is not None:
+            original_date = latest_dict["ReleaseDate"]
+            latest_dict["ReleaseDate"] = security_date
+            print(f"Updated {latest_version} ReleaseDate from {original_date} to {security_date}")
 
     # Write the updated feed structure back to a file
     with open(output_path, "w", encoding="utf-8") as json_file:
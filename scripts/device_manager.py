@@ -13,12 +13,12 @@ Simple flags for the 3 core maintenance scenarios
 """
 
 import json
+import re
 import typer
 from pathlib import Path
 from datetime import datetime
 from rich.console import Console
 from rich.table import Table
-from rich.prompt import Prompt, Confirm
 
 console = Console()
 app = typer.Typer(help="SOFA Device Manager - Simple device maintenance")
@@ -27,6 +27,15 @@ app = typer.Typer(help="SOFA Device Manager - Simple device maintenance")
 SOURCES_DIR = Path("data/models/sources") 
 OUTPUT_DIR = Path("data/resources")
 
+# Fixed field/status sets used while validating and cleaning device data
+REQUIRED_DEVICE_FIELDS = ("Model", "URL", "marketingName", "support_status", "DeviceID")
+VALID_SUPPORT_STATUSES = frozenset({"current", "vintage", "obsolete"})
+RETIRED_SUPPORT_STATUSES = frozenset({"vintage", "obsolete"})
+DESKTOP_MAC_MODELS = frozenset({"iMac", "Mac mini", "Mac Studio", "Mac Pro"})
+
+# Any of M1-M5, A15-A19 or S8-S10 anywhere in the processor name means Apple silicon
+APPLE_SILICON_RE = re.compile(r"M[1-5]|A1[5-9]|S(?:8|9|10)")
+
 # Smart defaults for guided device entry
 DEVICE_PATTERNS = {
     "macos": {
@@ -63,6 +72,14 @@ DEVICE_PATTERNS = {
     }
 }
 
+def write_json(path, data):
+    """Write device data as indented JSON in a single write
+
+    json.dumps serializes in one shot, whereas json.dump streams many small
+    chunks through the file object; the output bytes are the same.
+    """
+    path.write_text(json.dumps(data, indent=2))
+
 def _matches_filter(device_info, filter_str):
     """Check if device matches filter criteria"""
     filter_lower = filter_str.lower()
@@ -72,6 +89,35 @@ def _matches_filter(device_info, filter_str):
             return True
     return False
 
+def _platform_source_files(sources_dir=SOURCES_DIR):
+    """List the *_devices.json platform files in a sources directory
+
+    A single iterdir() pass with a suffix check, rather than pathlib's glob
+    pattern matching.
+    """
+    if not sources_dir.is_dir():
+        return []
+    return [path for path in sources_dir.iterdir() if path.name.endswith("_devices.json")]
+
+def _load_platform_devices(platform_file):
+    """Load devices from a platform source file, fixing its device_count metadata"""
+    if not platform_file.exists():
+        return None
+    
+    with open(platform_file) as f:
+        data = json.load(f)
+    
+    devices = data.get("devices", {})
+    
+    # Update metadata device_count to match actual count
+    actual_count = len(devices)
+    if data.get("metadata", {}).get("device_count", 0) != actual_count:
+        data["metadata"]["device_count"] = actual_count
+        # Write back corrected metadata
+        write_json(platform_file, data)
+    
+    return devices
+
 def rebuild_database():
     """Rebuild unified database from platform sources with hierarchical sorting"""
     console.print("🔨 Rebuilding unified database...", style="cyan")
@@ -79,54 +125,25 @@ def rebuild_database():
     # Platform order: macOS first, then iPads, iOS, tvOS, watchOS  
     platform_order = ["macos", "ipados", "ios", "tvos", "watchos"]
     
+    # Hierarchical order first, then any remaining platforms not in our order
+    platform_files = [SOURCES_DIR / f"{platform}_devices.json" for platform in platform_order]
+    platform_files += [
+        source_file for source_file in _platform_source_files()
+        if source_file.stem.replace("_devices", "") not in platform_order
+    ]
+    
     all_devices = {}
     platform_count = 0
     
-    # Build devices in hierarchical order
-    for platform in platform_order:
-        platform_file = SOURCES_DIR / f"{platform}_devices.json"
-        if platform_file.exists():
-            with open(platform_file) as f:
-                data = json.load(f)
-                
-                devices = data.get("devices", {})
-                
-                # Update metadata device_count to match actual count
-                actual_count = len(devices)
-                if data.get("metadata", {}).get("device_count", 0) != actual_count:
-                    data["metadata"]["device_count"] = actual_count
-                    # Write back corrected metadata
-                    with open(platform_file, "w") as f_write:
-                        json.dump(data, f_write, indent=2)
-                
-                # Preserve existing order from source files - no sorting
-                # Only new devices added via add-device get placed at top of their platform file
-                for device_id, device_data in devices.items():
-                    all_devices[device_id] = device_data
-                    
-                platform_count += 1
-    
-    # Add any remaining platforms not in our order
-    for source_file in SOURCES_DIR.glob("*_devices.json"):
-        platform = source_file.stem.replace("_devices", "")
-        if platform not in platform_order:
-            with open(source_file) as f:
-                data = json.load(f)
-                devices = data.get("devices", {})
-                
-                # Update metadata device_count to match actual count
-                actual_count = len(devices)
-                if data.get("metadata", {}).get("device_count", 0) != actual_count:
-                    data["metadata"]["device_count"] = actual_count
-                    # Write back corrected metadata
-                    with open(source_file, "w") as f_write:
-                        json.dump(data, f_write, indent=2)
-                
-                # Preserve existing order from source files
-                for device_id, device_data in devices.items():
-                    all_devices[device_id] = device_data
-                    
-                platform_count += 1
+    for platform_file in platform_files:
+        devices = _load_platform_devices(platform_file)
+        if devices is None:
+            continue
+        
+        # Preserve existing order from source files - no sorting
+        # Only new devices added via add-device get placed at top of their platform file
+        all_devices.update(devices)
+        platform_count += 1
     
     # Add metadata
     unified_db = {
@@ -145,8 +162,7 @@ def rebuild_database():
     
     # Write unified JSON file - use OUTPUT_DIR constant
     output_file = OUTPUT_DIR / "all_devices_enhanced.json"
-    with open(output_file, "w") as f:
-        json.dump(unified_db, f, indent=2)
+    write_json(output_file, unified_db)
     
     # Write NDJSON file (one device per line)
     ndjson_file = OUTPUT_DIR / "all_devices_enhanced.ndjson"
@@ -214,7 +230,7 @@ def add_device(
             if model_name.lower() in name.lower():
                 model = model_name
                 url = url_mapping["macos"][model_name] 
-                device_type = "Desktop" if model_name in ["iMac", "Mac mini", "Mac Studio", "Mac Pro"] else "Laptop"
+                device_type = "Desktop" if model_name in DESKTOP_MAC_MODELS else "Laptop"
                 break
     else:
         model_map = {"ios": "iPhone", "ipados": "iPad", "watchos": "Apple Watch", "tvos": "Apple TV"}
@@ -229,7 +245,7 @@ def add_device(
         "URL": url,
         "deviceType": device_type,
         "processorFamily": processor,
-        "processorType": "Apple Silicon" if any(x in processor for x in ["M1", "M2", "M3", "M4", "M5", "A15", "A16", "A17", "A18", "A19", "S8", "S9", "S10"]) else "Unknown",
+        "processorType": "Apple Silicon" if APPLE_SILICON_RE.search(processor) else "Unknown",
         "marketingName": name,
         "support_status": "current",
         "DeviceID": device_id
@@ -256,8 +272,7 @@ def add_device(
     data["metadata"]["last_updated"] = "2025-09-07"
     
     # Write updated file
-    with open(platform_file, "w") as f:
-        json.dump(data, f, indent=2)
+    write_json(platform_file, data)
     
     console.print(f"✅ Added {device_id} to {platform_file.name}", style="green")
     console.print(f"   {name} ({processor})")
@@ -268,6 +283,8 @@ def add_device(
 @app.command()
 def add_guided():
     """Guided device creation with smart defaults and proper supportedMajor"""
+    # Only the interactive command needs prompts, so keep them off the import path
+    from rich.prompt import Prompt, Confirm
     
     console.print("🤖 Guided Device Entry", style="bold blue")
     console.print("Smart defaults for proper SOFA device creation\n")
@@ -398,8 +415,7 @@ def drop_support(
             updated_devices.append((device_id, device_info.get("marketingName", "")))
     
     # Write updated file
-    with open(platform_file, "w") as f:
-        json.dump(data, f, indent=2)
+    write_json(platform_file, data)
     
     if updated_devices:
         console.print(f"✅ Updated {len(updated_devices)} devices to vintage:", style="green")
@@ -427,7 +443,7 @@ def fix_device(
     sources_dir = Path("data/models/sources")
     device_found = False
     
-    for platform_file in sources_dir.glob("*_devices.json"):
+    for platform_file in _platform_source_files(sources_dir):
         with open(platform_file) as f:
             data = json.load(f)
         
@@ -447,8 +463,7 @@ def fix_device(
                 devices[device_id][field] = value
             
             # Write updated file
-            with open(platform_file, "w") as f:
-                json.dump(data, f, indent=2)
+            write_json(platform_file, data)
             
             console.print(f"✅ Fixed {device_id} in {platform_file.name}", style="green")
             console.print(f"   {field}: {value}")
@@ -473,7 +488,7 @@ def search(
     
     found_devices = []
     
-    for platform_file in SOURCES_DIR.glob("*_devices.json"):
+    for platform_file in _platform_source_files():
         if platform and platform not in platform_file.stem:
             continue
             
@@ -577,7 +592,8 @@ def validate():
     issues = []
     total_devices = 0
     
-    for platform_file in SOURCES_DIR.glob("*_devices.json"):
+    platform_files = _platform_source_files()
+    for platform_file in platform_files:
         platform = platform_file.stem.replace("_devices", "")
         
         with open(platform_file) as f:
@@ -594,8 +610,7 @@ def validate():
         
         for device_id, device_info in devices.items():
             # Check required fields
-            required_fields = ["Model", "URL", "marketingName", "support_status", "DeviceID"]
-            for field in required_fields:
+            for field in REQUIRED_DEVICE_FIELDS:
                 if not device_info.get(field):
                     issues.append(f"{platform}:{device_id} missing {field}")
             
@@ -604,8 +619,7 @@ def validate():
                 issues.append(f"{platform}:{device_id} DeviceID mismatch")
             
             # Check support status values
-            valid_statuses = ["current", "vintage", "obsolete"]
-            if device_info.get("support_status") not in valid_statuses:
+            if device_info.get("support_status") not in VALID_SUPPORT_STATUSES:
                 issues.append(f"{platform}:{device_id} invalid support_status")
     
     if issues:
@@ -616,7 +630,7 @@ def validate():
             console.print(f"   • ... and {len(issues) - 10} more issues")
     else:
         console.print(f"✅ Database validation passed", style="green")
-        console.print(f"   📊 {total_devices} devices across {len(list(SOURCES_DIR.glob('*_devices.json')))} platforms")
+        console.print(f"   📊 {total_devices} devices across {len(platform_files)} platforms")
 
 @app.command()
 def status():
@@ -639,7 +653,7 @@ def status():
         total_current = 0
         total_vintage = 0
         
-        for platform_file in SOURCES_DIR.glob("*_devices.json"):
+        for platform_file in _platform_source_files():
             try:
                 with open(platform_file) as f:
                     data = json.load(f)
@@ -808,7 +822,7 @@ def cleanup_vintage(
         to_remove = []
         for device_id, device_info in devices.items():
             status = device_info.get("support_status", "")
-            if status in ["vintage", "obsolete"]:
+            if status in RETIRED_SUPPORT_STATUSES:
                 to_remove.append((device_id, device_info.get("marketingName", "Unknown")))
         
         if to_remove:
@@ -830,8 +844,7 @@ def cleanup_vintage(
                 data["metadata"]["last_updated"] = "2025-09-07"
                 
                 # Write back
-                with open(platform_file, "w") as f:
-                    json.dump(data, f, indent=2)
+                write_json(platform_file, data)
                 
                 console.print(f"  ✅ Cleaned {platform_file.name}: {original_count} → {len(devices)} devices", style="green")
             
@@ -14,11 +14,12 @@ Generates RSS feed from Apple security releases data, XProtect updates, and beta
 
 import json
 import hashlib
+import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Set, Optional
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom import minidom
+from xml.etree.ElementTree import Element, ElementTree, SubElement, indent
 import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -32,6 +33,14 @@ app = typer.Typer(help="Modern RSS feed generator for SOFA")
 import os
 SOFA_FQDN = os.getenv("SOFA_FQDN", os.getenv("SOFA_BASE_URL", "https://sofa.macadmins.io"))
 
+# Platforms worth including in the feed (XProtect and beta releases included)
+RELEVANT_PLATFORMS = (
+    "macOS", "iOS", "iPadOS", "visionOS", "tvOS", "watchOS", "Safari", "Xcode",
+    "XProtect", "beta",
+)
+# Single case-insensitive alternation so relevance is one regex search per release
+RELEVANT_PLATFORM_RE = re.compile("|".join(map(re.escape, RELEVANT_PLATFORMS)), re.IGNORECASE)
+
 
 def load_json_file(filepath: Path) -> Optional[Dict]:
     """Load and parse JSON file with Rich output"""
@@ -113,15 +122,36 @@ def load_security_releases(data_dir: str = "data/resources") -> List[Dict]:
     return releases
 
 
+# Parsed KEV catalogs keyed by path, stamped with the file's (mtime_ns, size)
+_kev_catalog_cache: Dict[Path, tuple] = {}
+
+
 def load_kev_catalog(data_dir: str = "data/resources") -> Set[str]:
-    """Load CISA KEV catalog to identify exploited CVEs"""
+    """Load CISA KEV catalog to identify exploited CVEs
+
+    extract_cves asks for the catalog once per release, so the parsed set is
+    cached and only re-read when the file's mtime or size changes.
+    """
     kev_file = Path(data_dir) / "kev_catalog.json"
+    try:
+        stat = kev_file.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        stamp = None
+
+    cached = _kev_catalog_cache.get(kev_file)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
     data = load_json_file(kev_file)
 
     if not data or "vulnerabilities" not in data:
-        return set()
+        kev_cves = set()
+    else:
+        kev_cves = {vuln["cveID"] for vuln in data["vulnerabilities"] if "cveID" in vuln}
 
-    return {vuln["cveID"] for vuln in data["vulnerabilities"] if "cveID" in vuln}
+    _kev_catalog_cache[kev_file] = (stamp, kev_cves)
+    return kev_cves
 
 
 def load_xprotect_updates(data_dir: str = "data/resources") -> List[Dict]:
@@ -240,9 +270,12 @@ def extract_cves(release: Dict, data_dir: str = "data/resources") -> Dict[str, b
     if "cves" in release:
         cve_data = release["cves"]
         if isinstance(cve_data, list):
-            for cve_id in cve_data:
-                if isinstance(cve_id, str) and cve_id.startswith("CVE-"):
-                    cves[cve_id] = cve_id in kev_catalog
+            # One comprehension instead of a per-CVE loop body with item stores
+            cves = {
+                cve_id: cve_id in kev_catalog
+                for cve_id in cve_data
+                if isinstance(cve_id, str) and cve_id.startswith("CVE-")
+            }
         elif isinstance(cve_data, dict):
             for cve_id, cve_info in cve_data.items():
                 if cve_id.startswith("CVE-"):
@@ -258,15 +291,39 @@ def extract_cves(release: Dict, data_dir: str = "data/resources") -> Dict[str, b
     return cves
 
 
+def parse_day(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD date, raising ValueError exactly like strptime
+
+    Well-formed ISO days (nearly every date in our data) go through the
+    C-implemented fromisoformat; anything else falls back to the pure-Python
+    strptime so the accepted inputs stay the same.
+    """
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+@lru_cache(maxsize=4096)
 def format_release_date(date_str: str) -> str:
-    """Format date string to RFC 822 format for RSS"""
+    """Format date string to RFC 822 format for RSS
+
+    Cached because the same release dates recur across many feed items.
+    """
     if not date_str or date_str == "null":
         # Return None for missing dates instead of fallback - let caller decide
         return None
 
-    # Try parsing different date formats
+    # Plain ISO days are by far the most common
+    try:
+        return parse_day(date_str).strftime("%a, %d %b %Y %H:%M:%S +0000")
+    except (ValueError, TypeError):
+        pass
+
+    # Try parsing the remaining date formats
     formats = [
-        "%Y-%m-%d",
         "%d %b %Y",
         "%B %d, %Y",
         "%Y-%m-%dT%H:%M:%SZ",
@@ -306,27 +363,13 @@ def create_feed_item(
         return None
 
     # Filter to only include relevant platforms
-    relevant_platforms = [
-        "macOS", "iOS", "iPadOS", "visionOS", "tvOS", "watchOS", "Safari", "Xcode",
-        "XProtect", "beta"  # Include XProtect and beta releases
-    ]
-    
-    # Check if product name contains any relevant platform
-    is_relevant = False
-    product_lower = product_name.lower()
-    
-    # Special handling for beta releases
-    if release_type == "beta" or "beta" in product_lower:
-        is_relevant = True
-    # Special handling for XProtect
-    elif release_type.startswith("xprotect") or "xprotect" in product_lower:
-        is_relevant = True
-    else:
-        # Check for platform names in product name
-        for platform in relevant_platforms:
-            if platform.lower() in product_lower:
-                is_relevant = True
-                break
+    # Beta and XProtect releases are always relevant; everything else must
+    # mention one of the tracked platforms in its product name
+    is_relevant = (
+        release_type == "beta"
+        or release_type.startswith("xprotect")
+        or RELEVANT_PLATFORM_RE.search(product_name) is not None
+    )
     
     if not is_relevant:
         return None
@@ -451,7 +494,7 @@ def create_feed_item(
         # Calculate days since previous release for same OS
         if previous_releases and date:
             try:
-                current_date = datetime.strptime(date, "%Y-%m-%d")
+                current_date = parse_day(date)
                 os_type = product_name.split()[0]  # Get OS type (macOS, iOS, etc.)
 
                 if os_type in previous_releases:
@@ -544,8 +587,13 @@ def write_data_to_rss(all_releases: List[Dict], output_file: Path, data_dir: str
         if not date_str:
             return datetime.min
 
-        # Try parsing common formats
-        for fmt in ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%M:%S.%fZ"]:
+        try:
+            return parse_day(date_str)
+        except ValueError:
+            pass
+
+        # Try parsing the timestamp formats
+        for fmt in ["%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%M:%S.%fZ"]:
             try:
                 return datetime.strptime(date_str, fmt)
             except ValueError:
@@ -575,7 +623,7 @@ def write_data_to_rss(all_releases: List[Dict], output_file: Path, data_dir: str
                 if name and date_str:
                     try:
                         os_type = name.split()[0]
-                        release_date = datetime.strptime(date_str, "%Y-%m-%d")
+                        release_date = parse_day(date_str)
                         if (
                             os_type not in previous_releases
                             or release_date < previous_releases[os_type]
@@ -584,27 +632,33 @@ def write_data_to_rss(all_releases: List[Dict], output_file: Path, data_dir: str
                     except (ValueError, KeyError):
                         pass
 
-    # Pretty print XML
-    xml_str = tostring(rss, encoding="unicode")
-    dom = minidom.parseString(xml_str)
-    pretty_xml = dom.toprettyxml(indent="  ", encoding="UTF-8")
+    # Pretty print XML in place rather than re-parsing the serialized tree with minidom
+    indent(rss, space="  ")
 
-    # Write to file
+    # Stream the tree straight into the file instead of building the whole
+    # document in memory first
     output_file.parent.mkdir(parents=True, exist_ok=True)
     with open(output_file, "wb") as f:
-        f.write(pretty_xml)
+        f.write(b'<?xml version="1.0" encoding="UTF-8"?>\n')
+        ElementTree(rss).write(f, encoding="UTF-8")
+        f.write(b"\n")
+
+    # Tally the summary counts in one pass over the releases
+    security_count = xprotect_count = beta_count = 0
+    for r in sorted_releases:
+        release_type = r.get("type", "os")
+        if release_type == "os":
+            security_count += 1
+        elif release_type == "beta":
+            beta_count += 1
+        elif "xprotect" in release_type:
+            xprotect_count += 1
 
     print(f"✅ RSS feed generated: {output_file}")
     print(f"   - Total items: {items_added}")
-    print(
-        f"   - Security updates: {sum(1 for r in sorted_releases if r.get('type', 'os') == 'os')}"
-    )
-    print(
-        f"   - XProtect updates: {sum(1 for r in sorted_releases if 'xprotect' in r.get('type', ''))}"
-    )
-    print(
-        f"   - Beta releases: {sum(1 for r in sorted_releases if r.get('type') == 'beta')}"
-    )
+    print(f"   - Security updates: {security_count}")
+    print(f"   - XProtect updates: {xprotect_count}")
+    print(f"   - Beta releases: {beta_count}")
     print(f"   - Duplicates removed: {len(sorted_releases) - items_added}")
 
 
@@ -630,19 +684,19 @@ def calculate_days_between_releases(releases: List[Dict]) -> None:
             os_releases, key=lambda x: x.get("date") or "", reverse=True
         )
 
-        # Calculate days between releases
-        for i in range(len(sorted_releases) - 1):
-            current_date = sorted_releases[i].get("date", "")
-            prev_date = sorted_releases[i + 1].get("date", "")
-
-            if current_date and prev_date:
-                try:
-                    current = datetime.strptime(current_date, "%Y-%m-%d")
-                    previous = datetime.strptime(prev_date, "%Y-%m-%d")
-                    days_diff = (current - previous).days
-                    sorted_releases[i]["days_since_previous"] = days_diff
-                except ValueError:
-                    pass
+        # Calculate days between releases, parsing each date once and carrying
+        # it forward as the next release's "current" date
+        current = None
+        for i, release in enumerate(sorted_releases):
+            date_str = release.get("date", "")
+            try:
+                parsed = parse_day(date_str) if date_str else None
+            except ValueError:
+                parsed = None
+
+            if i and current is not None and parsed is not None:
+                sorted_releases[i - 1]["days_since_previous"] = (current - parsed).days
+            current = parsed
 
 
 def main(
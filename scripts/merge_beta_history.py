@@ -98,13 +98,14 @@ def merge_beta_history(current_file: Path, source_file: Path, output_file: Path)
     
     merged_items.sort(key=lambda x: parse_date(x.get("released", "1900-01-01")), reverse=True)
     
-    # Create the merged data structure
+    # Create the merged data structure, stamping both fields from one clock read
+    timestamp = datetime.now().isoformat() + "Z"
     merged_data = {
         "UpdateHash": current_data.get("UpdateHash", "merged-data"),
-        "created_at": datetime.now().isoformat() + "Z",
+        "created_at": timestamp,
         "description": "Historical archive of Apple OS releases including betas removed from current feed",
         "items": merged_items,
-        "last_updated": datetime.now().isoformat() + "Z"
+        "last_updated": timestamp
     }
     
     # Add source info if it exists in either file
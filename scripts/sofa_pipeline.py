@@ -16,9 +16,13 @@ No complex path detection, no TOML parsing, just works.
 __version__ = "0.2.0"
 
 import json
+import os
+import signal
 import subprocess
 import sys
-from datetime import datetime
+import threading
+import time
+from collections import deque
 from pathlib import Path
 from typing import List, Dict, Any
 import typer
@@ -32,60 +36,122 @@ from rich.tree import Tree
 console = Console()
 app = typer.Typer(help=f"SOFA Pipeline Clean v{__version__}")
 
+# Lines of command output kept for display/diagnostics (older lines are dropped as they stream)
+OUTPUT_TAIL_LINES = 100
+# stderr lines kept for error messages, so failures report the binary's own error text
+STDERR_TAIL_LINES = 20
+
+# Working directories the pipeline stages write into, listed shallowest first
+# so each parent already exists by the time its children are created
+REQUIRED_DIRS = (
+    Path("data"),
+    Path("v1"),
+    Path("v2"),
+    Path("logs"),
+    Path("data/resources"),
+    Path("data/models"),
+    Path("data/cache"),
+)
+
 class StageResult:
+    __slots__ = ("name", "success", "duration", "message")
+    
     def __init__(self, name: str, success: bool, duration: float, message: str = ""):
         self.name = name
         self.success = success
         self.duration = duration
         self.message = message
 
+def count_entries(directory: Path) -> int:
+    """Count directory entries via scandir without building Path objects"""
+    with os.scandir(directory) as it:
+        return sum(1 for _ in it)
+
 def check_environment() -> bool:
     """Check that we're in the right environment"""
     if not Path("bin").exists() or not Path("config").exists():
         console.print("❌ Must run from repo root or processing folder (needs bin/ and config/)", style="red")
         return False
         
-    # Create necessary directories
-    Path("data/resources").mkdir(parents=True, exist_ok=True)
-    Path("data/models").mkdir(parents=True, exist_ok=True)
-    Path("data/cache").mkdir(parents=True, exist_ok=True) 
-    Path("v1").mkdir(parents=True, exist_ok=True)
-    Path("v2").mkdir(parents=True, exist_ok=True)
-    Path("logs").mkdir(parents=True, exist_ok=True)
+    # Create necessary directories; on warm runs they all exist, so a single
+    # stat each avoids the mkdir calls entirely
+    for directory in REQUIRED_DIRS:
+        if not directory.is_dir():
+            directory.mkdir(exist_ok=True)
     
     return True
 
 def run_binary_command(cmd: List[str], stage_name: str, timeout: int = 600) -> StageResult:
-    """Run a binary command and return result"""
-    start_time = datetime.now()
+    """Run a binary command and return result
+
+    stdout and stderr are streamed line by line and only their last lines
+    are kept, so chatty stages never buffer their full output in memory.
+    The command runs in its own session so a timeout kills any processes it
+    spawned as well, not just the direct child.
+    """
+    start_time = time.perf_counter()
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-        duration = (datetime.now() - start_time).total_seconds()
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1,
+            start_new_session=True
+        ) as proc:
+            def kill_process_group():
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            
+            timed_out = threading.Event()
+            
+            def kill_on_timeout():
+                timed_out.set()
+                kill_process_group()
+            
+            # Drain stderr on a helper thread so neither pipe can fill up and stall the command
+            stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+            stderr_reader = threading.Thread(target=stderr_tail.extend, args=(proc.stderr,), daemon=True)
+            stderr_reader.start()
+            
+            # Enforce the timeout while we are blocked reading output
+            timer = threading.Timer(timeout, kill_on_timeout)
+            timer.start()
+            try:
+                stdout_tail = deque(proc.stdout, maxlen=OUTPUT_TAIL_LINES)
+                stderr_reader.join()
+                returncode = proc.wait()
+            except BaseException:
+                # The command no longer shares our process group, so Ctrl-C won't reach it
+                kill_process_group()
+                raise
+            finally:
+                timer.cancel()
+        duration = time.perf_counter() - start_time
+        
+        # Only a timeout if our kill is what ended the command itself
+        if timed_out.is_set() and returncode == -signal.SIGKILL:
+            return StageResult(stage_name, False, duration, f"Timed out after {timeout}s")
         
         # Show command output for transparency (last 300 chars to keep it readable)
-        if result.stdout:
-            # Clean up and show relevant output only
-            clean_output = result.stdout.strip()
-            if len(clean_output) > 300:
-                clean_output = "..." + clean_output[-300:]
+        clean_output = "".join(stdout_tail).strip()
+        if len(clean_output) > 300:
+            clean_output = "..." + clean_output[-300:]
+        if clean_output:
             console.print(f"[dim]stdout: {clean_output}[/dim]")
-        if result.stderr:
-            console.print(f"[red]stderr: {result.stderr[-300:]}[/red]")
+        stderr_output = "".join(stderr_tail).strip()[-300:]
+        if stderr_output:
+            console.print(f"[red]stderr: {stderr_output}[/red]")
         
-        if result.returncode == 0:
+        if returncode == 0:
             return StageResult(stage_name, True, duration, "Completed successfully")
         else:
-            error_msg = f"Exit code {result.returncode}"
-            if result.stderr:
-                error_msg += f": {result.stderr[:300]}"
+            error_msg = f"Exit code {returncode}"
+            if stderr_output:
+                error_msg += f": {stderr_output}"
             return StageResult(stage_name, False, duration, error_msg)
             
-    except subprocess.TimeoutExpired:
-        duration = (datetime.now() - start_time).total_seconds()
-        return StageResult(stage_name, False, duration, f"Timed out after {timeout}s")
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         return StageResult(stage_name, False, duration, str(e))
 
 def run_gather() -> StageResult:
@@ -272,6 +338,48 @@ def run_transform_links() -> StageResult:
     
     return result
 
+def run_build() -> StageResult:
+    """Build all feeds (v1 + v2) in legacy mode"""
+    # Here we build all feeds with legacy mode in single call
+    console.rule("[bold blue]Build All Feeds")
+    console.print("🔧 Building all feeds (v1 + v2) with legacy mode...")
+    
+    cmd = ["./bin/sofa-build", "all", "--legacy"]
+    console.print(f"🚀 Running: {' '.join(cmd)}")
+    result = run_binary_command(cmd, "build_all", 600)
+    
+    if result.success:
+        console.print("✅ All feeds built successfully", style="green")
+        
+        # Show build results for both versions
+        table = Table(title="Build Results")
+        table.add_column("Version", style="cyan")
+        table.add_column("Product", style="blue")
+        table.add_column("Status", style="green")
+        
+        for version in ["v1", "v2"]:
+            for product in ["safari", "ios", "macos", "tvos", "watchos", "visionos"]:
+                feed_file = Path(f"{version}/{product}_data_feed.json")
+                status = "✅" if feed_file.exists() else "❌"
+                table.add_row(version, product, status)
+        
+        console.print(table)
+        
+    else:
+        console.print(f"❌ Build failed: {result.message}", style="red")
+    
+    return result
+
+# Stage name -> runner, looked up once per stage instead of walking an if/elif chain
+STAGE_RUNNERS = {
+    "gather": run_gather,
+    "fetch": run_fetch,
+    "build": run_build,
+    "bulletin": run_bulletin,
+    "rss": run_rss,
+    "transform_links": run_transform_links,
+}
+
 
 def verify_results() -> None:
     """Display comprehensive results verification"""
@@ -396,51 +504,12 @@ def run(
         stages = [stage]
     
     for stage_name in stages:
-        if stage_name == "gather":
-            result = run_gather()
-        elif stage_name == "fetch":
-            result = run_fetch()
-        elif stage_name == "build":
-            # Here we build all feeds with legacy mode in single call
-            console.rule("[bold blue]Build All Feeds")
-            console.print("🔧 Building all feeds (v1 + v2) with legacy mode...")
-            
-            cmd = ["./bin/sofa-build", "all", "--legacy"]
-            console.print(f"🚀 Running: {' '.join(cmd)}")
-            result = run_binary_command(cmd, "build_all", 600)
-            
-            if result.success:
-                console.print("✅ All feeds built successfully", style="green")
-                
-                # Show build results for both versions
-                table = Table(title="Build Results")
-                table.add_column("Version", style="cyan")
-                table.add_column("Product", style="blue")
-                table.add_column("Status", style="green")
-                
-                for version in ["v1", "v2"]:
-                    for product in ["safari", "ios", "macos", "tvos", "watchos", "visionos"]:
-                        feed_file = Path(f"{version}/{product}_data_feed.json")
-                        status = "✅" if feed_file.exists() else "❌"
-                        table.add_row(version, product, status)
-                
-                console.print(table)
-                
-            else:
-                console.print(f"❌ Build failed: {result.message}", style="red")
-                
-            results.append(result)
-            continue
-        elif stage_name == "bulletin":
-            result = run_bulletin()
-        elif stage_name == "rss":
-            result = run_rss()
-        elif stage_name == "transform_links":
-            result = run_transform_links()
-        else:
+        runner = STAGE_RUNNERS.get(stage_name)
+        if runner is None:
             console.print(f"❌ Unknown stage: {stage_name}", style="red")
             continue
-            
+        
+        result = runner()
         results.append(result)
         
         if not result.success and stage != "all":
@@ -503,7 +572,7 @@ def check():
         path = Path(path_str)
         if path.exists():
             if path.is_dir():
-                file_count = len(list(path.iterdir()))
+                file_count = count_entries(path)
                 console.print(f"  ✅ {path_str} ({file_count} items)")
             else:
                 console.print(f"  ✅ {path_str}")